@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import shutil
 import sys
 from dataclasses import dataclass
@@ -52,6 +53,49 @@ class BuildError(RuntimeError):
     pass
 
 
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Symlink *src* to *dst*, falling back to a copy where symlinks are unavailable.
+
+    An existing *dst* is replaced, so the last of several same-named results wins.
+    """
+    # Never write through a link left by an earlier same-named file
+    dst.unlink(missing_ok=True)
+    try:
+        dst.symlink_to(src)
+    except FileExistsError:
+        raise
+    except (OSError, NotImplementedError):
+        # Symlinks are unsupported here (e.g. Windows without privileges).
+        # dst is a fresh path, so copyfile cannot follow a link onto src.
+        # Metadata is irrelevant for these transient copies
+        shutil.copyfile(src, dst)
+
+
+# Resolved template dir -> its styles.css; only successful lookups are kept
+_STYLES_CACHE: dict[Path, Path] = {}
+
+
+def _resolve_styles(template_dir: str | Path | None) -> Path:
+    """Locate styles.css, caching template-dir hits across repeated renders.
+
+    Priority: 1. template_dir/styles.css 2. package_dir/styles.css
+    """
+    if template_dir:
+        template_base = Path(template_dir).expanduser().resolve()
+        cached = _STYLES_CACHE.get(template_base)
+        if cached is not None:
+            return cached
+        if (template_base / "styles.css").exists():
+            _STYLES_CACHE[template_base] = template_base / "styles.css"
+            return template_base / "styles.css"
+
+    # Fallback to package directory
+    styles_css = Path(__file__).parent / "styles.css"
+    if not styles_css.exists():
+        logger.warning("styles.css not found at {}", styles_css)
+    return styles_css
+
+
 def clean_output_dir(output_dir: Path) -> None:
     """Remove all generated files from a previous build.
 
@@ -103,20 +147,7 @@ def render_site_from_results(
     # Always start from a clean output directory
     clean_output_dir(output_site_dir)
     
-    # Locate styles.css
-    # Priority: 1. template_dir/styles.css 2. package_dir/styles.css
-    styles_css = None
-    if template_dir:
-        template_base = Path(template_dir).expanduser().resolve()
-        if (template_base / "styles.css").exists():
-            styles_css = template_base / "styles.css"
-    
-    if styles_css is None:
-        # Fallback to package directory
-        styles_css = Path(__file__).parent / "styles.css"
-
-    if not styles_css.exists():
-        logger.warning("styles.css not found at {}", styles_css)
+    styles_css = _resolve_styles(template_dir)
 
     results_paths = [Path(p).expanduser().resolve() for p in results_files]
     
@@ -138,13 +169,14 @@ def render_site_from_results(
         if not p.exists():
             raise BuildError(f"Results file not found: {p}")
 
-    # Use a temp dir to aggregate results because build_site expects a directory
+    # Use a temp dir to aggregate results because build_site expects a directory.
+    # Files are symlinked rather than copied so large results are not duplicated.
     with tempfile.TemporaryDirectory() as tmp:
         tmp_results_dir = Path(tmp) / "results"
         tmp_results_dir.mkdir()
         
         for src in results_paths:
-            shutil.copy2(src, tmp_results_dir / src.name)
+            _link_or_copy(src, tmp_results_dir / src.name)
 
         # Also copy per-bins files (.jsonl.gz, .jsonl and legacy .json) from
         # the same source directories so that map_processing.py can find them.
@@ -157,7 +189,7 @@ def render_site_from_results(
             ):
                 dst = tmp_results_dir / pb_file.name
                 if not dst.exists():
-                    shutil.copy2(pb_file, dst)
+                    _link_or_copy(pb_file, dst)
             
         build_site(output_site_dir, tmp_results_dir, styles_css, custom_config, site_base_url=site_base_url, precision=precision, skip_frt_snapshots=skip_frt_snapshots)
 
@@ -211,12 +243,21 @@ def render_site_from_results_dir(
     else:
         effective_config = None
 
-    # Pass all json files in the directory that look like results
-    result_files = list(results_dir.glob("results_*.json"))
-    if not result_files:
-        # Fallback to all json if strict naming isn't found
-        result_files = [f for f in results_dir.glob("*.json")
-                        if f.name != "leaderboard_config.json"]
+    # Pass all json files in the directory that look like results,
+    # sorting strict and loose names in a single directory scan
+    strict_files: list[Path] = []
+    loose_files: list[Path] = []
+    with os.scandir(results_dir) as it:
+        for entry in it:
+            name = entry.name
+            if not name.endswith(".json") or not entry.is_file():
+                continue
+            if name.startswith("results_"):
+                strict_files.append(Path(entry.path))
+            elif name != "leaderboard_config.json":
+                loose_files.append(Path(entry.path))
+    # Fallback to all json if strict naming isn't found
+    result_files = strict_files or loose_files
 
     # If include_benchmarks is True, acceptable to have no files in users dir,
     # as long as benchmarks exist. But normally user wants to compare SOMETHING.
@@ -7,64 +7,327 @@ changes the model name, and saves it as a new file.
 """
 
 import json
+import math
+import os
 import sys
-from typing import Any, Dict, List
+import tempfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
 from loguru import logger
 
+try:
+    import ijson as _ijson
+    _HAS_IJSON = True
+    _IJSON_ERRORS: Tuple[type, ...] = (_ijson.JSONError,)
+except ImportError:  # pragma: no cover
+    _HAS_IJSON = False
+    _IJSON_ERRORS = ()
 
-def add_noise(obj: Any, std_rel: float) -> Any:
-    """Add Gaussian noise to numerical values in a JSON structure."""
-    if isinstance(obj, dict):
-        return {k: add_noise(v, std_rel) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [add_noise(v, std_rel) for v in obj]
-    elif isinstance(obj, (int, float)):
-        noise = np.random.normal(0, abs(obj) * std_rel)
-        return float(round(obj + noise, 8))
-    else:
+# Both serializers write compact UTF-8 and keep NaN/Infinity as json.dump does
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+try:
+    import orjson as _orjson
+    def _json_loads(s: Any) -> Any:
+        try:
+            return _orjson.loads(s)
+        except _orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity tokens that json.dump writes
+            return json.loads(s)
+    def _json_dumps(obj: Any) -> bytes:
+        out = _orjson.dumps(obj)
+        # orjson writes non-finite floats as null
+        if b"null" in out and _has_non_finite(obj):
+            return _stdlib_dumps(obj)
+        return out
+except ImportError:
+    def _json_loads(s: Any) -> Any:  # type: ignore[misc]
+        return json.loads(s)
+    _json_dumps = _stdlib_dumps
+
+# Fallback generator used when the caller does not provide one
+_RNG = np.random.default_rng(42)
+
+
+def _iter_numeric_leaves(obj: Any) -> Iterator[Tuple[Any, Any, float]]:
+    """Yield ``(parent, key, value)`` for every numerical leaf of a JSON structure.
+
+    The tree is walked iteratively with an explicit stack of child iterators,
+    in document order. ``obj`` must be a dict or a list.
+    """
+    stack: List[Tuple[Any, Iterator[Tuple[Any, Any]]]] = [
+        (obj, iter(obj.items()) if isinstance(obj, dict) else enumerate(obj))
+    ]
+    while stack:
+        parent, children = stack[-1]
+        for key, value in children:
+            if isinstance(value, dict):
+                stack.append((value, iter(value.items())))
+                break
+            if isinstance(value, list):
+                stack.append((value, enumerate(value)))
+                break
+            # bool is a subclass of int: flags must not be perturbed
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                yield parent, key, value
+        else:
+            stack.pop()
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Whether a JSON structure holds a NaN or infinite float."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if not isinstance(obj, (dict, list)):
+        return False
+    return any(
+        isinstance(value, float) and not math.isfinite(value)
+        for _, _, value in _iter_numeric_leaves(obj)
+    )
+
+
+def add_noise(obj: Any, std_rel: float, rng: Optional[np.random.Generator] = None) -> Any:
+    """Add Gaussian noise to numerical values in a JSON structure.
+
+    Numerical leaves are collected first so that all the noise is drawn in a
+    single vectorized call, then written back in place: the input structure
+    is mutated rather than copied.
+    """
+    if rng is None:
+        rng = _RNG
+
+    # Bare numbers skip the array round-trip and draw a single scalar
+    if not isinstance(obj, (dict, list)):
+        if isinstance(obj, (int, float)) and not isinstance(obj, bool):
+            return float(round(obj + rng.standard_normal() * abs(obj) * std_rel, 8))
         return obj
 
+    parents: List[Any] = []
+    keys: List[Any] = []
+    values: List[float] = []
+    for parent, key, value in _iter_numeric_leaves(obj):
+        parents.append(parent)
+        keys.append(key)
+        values.append(value)
+
+    if not values:
+        return obj
+
+    values_arr = np.fromiter(values, dtype=np.float64, count=len(values))
+    # Noise scale and noisy values are computed in place on two buffers.
+    # NaN/inf values stay NaN/inf, without warnings
+    noisy = rng.standard_normal(values_arr.shape)
+    with np.errstate(invalid="ignore"):
+        scale = np.abs(values_arr)
+        np.multiply(scale, std_rel, out=scale)
+        np.multiply(noisy, scale, out=noisy)
+        np.add(values_arr, noisy, out=noisy)
+        np.round(noisy, 8, out=noisy)
+
+    # tolist() converts to Python floats in a single C pass
+    for parent, key, v in zip(parents, keys, noisy.tolist()):
+        parent[key] = v
+    return obj
+
+
+def _build_value(events: Iterator[Tuple[str, str, Any]], event: str, value: Any) -> Any:
+    """Build a Python value from an ijson event stream, starting at ``(event, value)``."""
+    if event not in ("start_map", "start_array"):
+        return value
+    builder = _ijson.ObjectBuilder()
+    builder.event(event, value)
+    depth = 1
+    for _, event, value in events:
+        builder.event(event, value)
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+            if depth == 0:
+                break
+    return builder.value
 
-def process_file(src_path: str, dst_path: str, new_model: str, std_rel: float = 0.05) -> None:
-    """Read a JSON file, add noise to results, and save to a new file."""
-    with open(src_path) as f:
-        data = json.load(f)
+
+def _stream_entries(events: Iterator[Tuple[str, str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Yield the entries of a ``results`` mapping one at a time, whatever the model key."""
+    for _, event, _value in events:
+        if event == "end_map":
+            return
+        if event != "map_key":
+            continue
+        _, event, value = next(events)
+        if event != "start_array":
+            # Iterated like the full-load path does, so odd values still fail loudly
+            yield from _build_value(events, event, value)
+            continue
+        for _, event, value in events:
+            if event == "end_array":
+                break
+            yield _build_value(events, event, value)
+
+
+def _stream_document(f: BinaryIO, stream: bool = _HAS_IJSON) -> Iterator[Tuple[str, Any]]:
+    """Yield the top-level ``(key, value)`` pairs of a results file.
+
+    With ``stream`` (requires ijson), the document is parsed incrementally and
+    the value for ``results`` is a lazy iterator over its entries, so only one
+    entry is held in memory at a time. ijson only accepts strict JSON. Without
+    ``stream``, the whole document is loaded.
+    """
+    if not stream:
+        data = _json_loads(f.read())
+        for key, value in data.items():
+            if key == "results" and isinstance(value, dict):
+                value = (entry for entries in value.values() for entry in entries)
+            yield key, value
+        return
+
+    events = iter(_ijson.parse(f, use_float=True))
+    for prefix, event, value in events:
+        if prefix != "" or event != "map_key":
+            continue
+        key = value
+        _, event, value = next(events)
+        if key == "results" and event == "start_map":
+            yield key, _stream_entries(events)
+        else:
+            yield key, _build_value(events, event, value)
+
+
+def _noisy_entry(
+    entry: Dict[str, Any], new_model: str, std_rel: float, seed_seq: np.random.SeedSequence
+) -> Dict[str, Any]:
+    """Rename the model of a results entry and add noise to its result."""
+    entry["model"] = new_model
+    if "result" in entry:
+        entry["result"] = add_noise(entry["result"], std_rel, np.random.default_rng(seed_seq))
+    return entry
+
+
+def _noisy_entries(
+    entries: Iterator[Dict[str, Any]],
+    new_model: str,
+    std_rel: float,
+    seed_seq: np.random.SeedSequence,
+    workers: int = 1,
+) -> Iterator[Dict[str, Any]]:
+    """Yield noisy entries in input order, each with its own spawned noise stream.
+
+    Child seeds are spawned in input order, so the output does not depend on
+    ``workers``. With several workers, entries are dispatched to a process
+    pool in bounded batches to keep memory usage flat.
+    """
+    if workers <= 1:
+        for entry in entries:
+            yield _noisy_entry(entry, new_model, std_rel, seed_seq.spawn(1)[0])
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while batch := list(islice(entries, workers * 16)):
+            yield from executor.map(
+                _noisy_entry, batch, repeat(new_model), repeat(std_rel), seed_seq.spawn(len(batch))
+            )
+
+
+def _write_document(
+    src: BinaryIO,
+    dst: BinaryIO,
+    new_model: str,
+    std_rel: float,
+    seed: int,
+    workers: int,
+    stream: bool,
+) -> None:
+    """Write the noisy copy of ``src`` to ``dst``, one entry per line."""
+    seed_seq = np.random.SeedSequence(seed)
 
     # Replace dataset name
-    data["dataset"] = new_model
+    dst.write(b'{\n  "dataset": ' + _json_dumps(new_model))
+
+    for key, value in _stream_document(src, stream):
+        if key == "dataset":
+            continue
+        dst.write(b",\n  " + _json_dumps(key) + b": ")
+        if key != "results" or not isinstance(value, Iterator):
+            dst.write(_json_dumps(value))
+            continue
+
+        # Gather all entries under the new model name, regardless of the old one
+        dst.write(b"{" + _json_dumps(new_model) + b": [")
+        for i, entry in enumerate(_noisy_entries(value, new_model, std_rel, seed_seq, workers)):
+            dst.write(b",\n" if i else b"\n")
+            dst.write(_json_dumps(entry))
+        dst.write(b"\n  ]}")
+
+    dst.write(b"\n}\n")
+
 
-    # Replace model name in all entries
-    if "results" in data and isinstance(data["results"], dict):
-        # Retrieve all entries regardless of the old model name
-        all_entries: List[Dict[str, Any]] = []
-        for entries in data["results"].values():
-            all_entries.extend(entries)
+def process_file(
+    src_path: str,
+    dst_path: str,
+    new_model: str,
+    std_rel: float = 0.05,
+    seed: Optional[int] = None,
+    workers: int = 1,
+) -> None:
+    """Read a JSON file, add noise to results, and save to a new file.
 
-        # Modify the "model" field in each entry
-        for entry in all_entries:
-            entry["model"] = new_model
-            if "result" in entry:
-                entry["result"] = add_noise(entry["result"], std_rel)
+    Entries are written out as soon as they are processed (one per line), so
+    peak memory stays around a single entry when ijson is available. Files
+    ijson rejects (e.g. with NaN values) are processed again with a full load.
 
-        # Replace the key in "results" with the new name
-        data["results"] = {new_model: all_entries}
+    Unless an explicit ``seed`` is given, the noise generator is seeded from
+    ``new_model`` so that each generated file is reproducible on its own.
+    Every entry draws from its own child of that seed, so ``workers`` > 1
+    processes entries in parallel without changing the output.
+    """
+    if seed is None:
+        seed = zlib.crc32(new_model.encode("utf-8"))
 
-    with open(dst_path, "w") as f:
-        json.dump(data, f, indent=2)
+    # Written next to dst_path and moved over it only once complete, so a
+    # failure never truncates dst_path (which may also be src_path)
+    dst_dir = os.path.dirname(os.path.abspath(dst_path))
+    with open(src_path, "rb") as src, tempfile.NamedTemporaryFile(
+        "wb", dir=dst_dir, suffix=".tmp", delete=False
+    ) as dst:
+        try:
+            try:
+                _write_document(src, dst, new_model, std_rel, seed, workers, _HAS_IJSON)
+            except _IJSON_ERRORS as exc:
+                logger.warning("Streaming parse of {} failed ({}), loading it fully", src_path, exc)
+                src.seek(0)
+                dst.seek(0)
+                dst.truncate()
+                _write_document(src, dst, new_model, std_rel, seed, workers, stream=False)
+        except BaseException:
+            dst.close()
+            os.unlink(dst.name)
+            raise
+    # NamedTemporaryFile is private (0600); give the result open()'s usual mode
+    umask = os.umask(0)
+    os.umask(umask)
+    os.chmod(dst.name, 0o666 & ~umask)
+    os.replace(dst.name, dst_path)
 
 
 if __name__ == "__main__":
     if len(sys.argv) < 4:
-        logger.error("Usage: python gen_noisy_results.py <src.json> <dst.json> <new_model> [std_rel]")
+        logger.error(
+            "Usage: python gen_noisy_results.py <src.json> <dst.json> <new_model> [std_rel] [workers]"
+        )
         sys.exit(1)
 
     src, dst, new_model_arg = sys.argv[1:4]
     std_rel_arg = float(sys.argv[4]) if len(sys.argv) > 4 else 0.05
+    workers_arg = int(sys.argv[5]) if len(sys.argv) > 5 else 1
 
-    np.random.seed(42)
-    process_file(src, dst, new_model_arg, std_rel_arg)
+    process_file(src, dst, new_model_arg, std_rel_arg, workers=workers_arg)
 
     # Example usage:
     # python gen_noisy_results.py results/results_glonet.json \
@@ -5,19 +5,20 @@ Inspired by Google Research's WeatherBench design.
 """
 
 import base64
-import glob
+import functools
 import io
 import re
 import shutil
 from pathlib import Path
-from typing import List, Tuple, Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import matplotlib.pyplot as plt
 from dcleaderboard.processing import (
+    _SPACER_HTML,
+    _TOP_SPACER_HTML,
     create_legend_plot,
     generate_report_items,
     load_data,
 )
-from typing import Dict
 from loguru import logger
 
 def _merge_configs(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
@@ -64,20 +65,24 @@ GITHUB_SVG = '<svg viewBox="0 0 16 16" fill="currentColor"><path d="M8 0C3.58 0
 OCEAN_SVG = '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M2 12c1.5-2 3.5-3 5-3s3.5 1 5 3c1.5 2 3.5 3 5 3s3.5-1 5-3"/><path d="M2 7c1.5-2 3.5-3 5-3s3.5 1 5 3c1.5 2 3.5 3 5 3s3.5-1 5-3"/><path d="M2 17c1.5-2 3.5-3 5-3s3.5 1 5 3c1.5 2 3.5 3 5 3s3.5-1 5-3"/></svg>'
 
 
+_SLUG_SEP_RE = re.compile(r'[^a-z0-9]+')
+
+# Markdown heading prefixes, most specific first
+_HEADING_PREFIXES = (("#### ", "h4"), ("### ", "h3"), ("## ", "h2"))
+
+
 def _slugify(text: str) -> str:
     """Convert text to a URL-friendly slug."""
-    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+    return _SLUG_SEP_RE.sub('-', text.lower()).strip('-')
 
 
 def markdown_to_html(md_text: str) -> str:
     """Basic Markdown -> HTML conversion for titles and formatting."""
-    if md_text.startswith("#### "):
-        return f"<h4>{md_text[5:]}</h4>"
-    elif md_text.startswith("### "):
-        return f"<h3>{md_text[4:]}</h3>"
-    elif md_text.startswith("## "):
-        return f"<h2>{md_text[3:]}</h2>"
-    elif md_text.startswith("*") and md_text.endswith("*"):
+    if md_text.startswith("#"):
+        for prefix, tag in _HEADING_PREFIXES:
+            if md_text.startswith(prefix):
+                return f"<{tag}>{md_text[len(prefix):]}</{tag}>"
+    if md_text.startswith("*") and md_text.endswith("*"):
         return f"<i>{md_text[1:-1]}</i>"
     return f"<p>{md_text}</p>" if not md_text.strip().startswith("<") else md_text
 
@@ -245,11 +250,32 @@ def build_page(title: str, content: str, active_page: str = "", config: Dict[str
 """
 
 
+@functools.lru_cache(maxsize=1)
+def _legend_b64() -> str:
+    """Render the (constant) legend plot once and return it as base64 PNG."""
+    logger.debug("Generating legend plot...")
+    fig = create_legend_plot()
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", bbox_inches="tight", dpi=150, pil_kwargs={"optimize": False})
+    plt.close(fig)
+    return base64.b64encode(buf.getvalue()).decode("utf-8")
+
+
+def _write_card(html: io.StringIO, section_id: str, parts: List[str]) -> None:
+    """Write buffered parts wrapped in a leaderboard card, one per line."""
+    html.write(f'<div class="leaderboard-card" id="{section_id}">\n')
+    for part in parts:
+        html.write(part)
+        html.write("\n")
+    html.write('</div>\n')
+
+
 def generate_leaderboard_content(results_dir: Path, config: Dict[str, Any]) -> str:
     """Generate the HTML content for the leaderboard page."""
     logger.debug("Loading data for leaderboard...")
     df = load_data(results_dir)
-    html_parts = []
+    # Parts are written newline-separated, as the former "\n".join did
+    html = io.StringIO()
     
     # Collect section anchors for nav
     sections: List[Tuple[str, str]] = []
@@ -264,18 +290,18 @@ def generate_leaderboard_content(results_dir: Path, config: Dict[str, Any]) -> s
             sections.append((slug, label))
 
     # Section nav
-    html_parts.append(build_section_nav(sections))
+    html.write(build_section_nav(sections))
+    html.write("\n")
 
-    # Second pass: build actual content
-    for item_type, content in generate_report_items(df, config=config):
+    # Second pass: build actual content.
+    # The page holds a single report, so a fixed id prefix keeps builds reproducible
+    for item_type, content in generate_report_items(df, config=config, uuid_prefix="lb"):
         if item_type == "markdown":
-            if '<div style="height: 50px;"></div>' in content:
+            if content == _SPACER_HTML:
                 if card_buffer:
-                    html_parts.append(f'<div class="leaderboard-card" id="{current_section_id}">')
-                    html_parts.extend(card_buffer)
-                    html_parts.append('</div>')
+                    _write_card(html, current_section_id, card_buffer)
                     card_buffer = []
-            elif '<div style="height: 90px;"></div>' in content:
+            elif content == _TOP_SPACER_HTML:
                 # Skip the old spacer
                 continue
             else:
@@ -292,27 +318,19 @@ def generate_leaderboard_content(results_dir: Path, config: Dict[str, Any]) -> s
 
     # Flush any remaining content
     if card_buffer:
-        html_parts.append(f'<div class="leaderboard-card" id="{current_section_id}">')
-        html_parts.extend(card_buffer)
-        html_parts.append('</div>')
+        _write_card(html, current_section_id, card_buffer)
             
     # Legend Plot
-    logger.debug("Generating legend plot...")
-    fig = create_legend_plot()
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png", bbox_inches="tight", dpi=150)
-    buf.seek(0)
-    img_str = base64.b64encode(buf.read()).decode("utf-8")
-    plt.close(fig)
-    
-    html_parts.append(
+    img_str = _legend_b64()
+
+    html.write(
         f'<div class="legend-section">\n'
         f'<div class="legend-container">\n'
         f'<span class="legend-title">Color Scale</span>\n'
         f'<img src="data:image/png;base64,{img_str}" style="max-width: 520px; height: auto;" />\n'
         f'</div></div>'
     )
-    return "\n".join(html_parts)
+    return html.getvalue()
 
 
 def generate_about_content(config: Dict[str, Any] = None) -> str:
@@ -379,8 +397,8 @@ def build_site(
         config=config,
         include_hero=True,
     )
-    with open(output_dir / "leaderboard.html", "w", encoding="utf-8") as f:
-        f.write(leaderboard_html)
+    # Pages are encoded in one call and written in binary mode
+    (output_dir / "leaderboard.html").write_bytes(leaderboard_html.encode("utf-8"))
     logger.opt(colors=True).info("  <cyan>✓</cyan>  leaderboard.html generated")
 
     # Build Maps page (if per_bins data exists)
@@ -399,8 +417,7 @@ def build_site(
                 build_footer_fn=build_footer,
                 site_base_url=site_base_url,
             )
-            with open(output_dir / "maps.html", "w", encoding="utf-8") as f:
-                f.write(maps_html)
+            (output_dir / "maps.html").write_bytes(maps_html.encode("utf-8"))
             logger.opt(colors=True).info("  <cyan>✓</cyan>  maps.html generated")
         else:
             logger.opt(colors=True).info("  <dim>◡</dim>  Skipping maps.html (no per-bins data)")
@@ -419,8 +436,7 @@ def build_site(
         config=config,
         include_hero=False,
     )
-    with open(output_dir / "about.html", "w", encoding="utf-8") as f:
-        f.write(about_html)
+    (output_dir / "about.html").write_bytes(about_html.encode("utf-8"))
     logger.opt(colors=True).info("  <cyan>✓</cyan>  about.html generated")
 
     logger.opt(colors=True).success("  <green>✓✓</green>  Site build complete!")
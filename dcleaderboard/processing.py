@@ -6,16 +6,33 @@ HTML generation via Pandas Styler, and Matplotlib-based visualizations.
 """
 
 import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import count, groupby
 from pathlib import Path
 from typing import Any, Dict, Generator, List, Tuple, Optional
 
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from pandas.io.formats.style import Styler
 from matplotlib import cm
 from matplotlib.colors import Normalize, Colormap
 
+try:
+    import orjson as _orjson
+    def _json_loads(s: Any) -> Any:
+        try:
+            return _orjson.loads(s)
+        except _orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity tokens that json.dump writes
+            return json.loads(s)
+except ImportError:
+    def _json_loads(s: Any) -> Any:  # type: ignore[misc]
+        return json.loads(s)
+
 METRICS_NAMES = {
     "rmse": "Root Mean Squared Error",
     "rmsd": "Root Mean Squared Deviation",
@@ -24,32 +41,85 @@ METRICS_NAMES = {
     "lagrangian": "Lagrangian analysis",
 }
 
-
+# Spacer markers emitted between report items; html_builder compares
+# markdown items against them to split the page into cards.
+_TOP_SPACER_HTML = '<div style="height: 90px;"></div>'
+_SPACER_HTML = '<div style="height: 50px;"></div>'
+
+# Numbers the generate_report_items calls, for default table id prefixes
+_REPORT_IDS = count()
+
+# Table styles shared by every report table; per-table border styles go first
+_STATIC_TABLE_STYLES = [
+    # Center align data cells (skipping the first column which is the index)
+    {"selector": "td:not(:first-child)", "props": [("text-align", "center")]},
+    # Center align all headers
+    {"selector": "th.col_heading", "props": [("text-align", "center")]},
+    # Variable headers (Level 0): Bold
+    {
+        "selector": "th.col_heading.level0",
+        "props": [("text-align", "center"), ("font-weight", "bold")],
+    },
+    # Lead day headers (Level 1): Smaller font
+    {
+        "selector": "th.col_heading.level1",
+        "props": [("text-align", "center"), ("font-size", "0.9em")],
+    },
+]
+
+# Variable / lead day name patterns
+_DEPTH_RE = re.compile(r"(\d+)m")
+# "surface" words and "<n>m" depths in one pass; the remaining patterns stay
+# separate since they only match once the earlier tokens have been removed
+_SURFACE_OR_DEPTH_RE = re.compile(r"\bsurface\b|\d+m\b")
+_DEPTH_UM_RE = re.compile(r"\d+_m\b")
+_SURFACE_SUFFIX_RE = re.compile(r"_surface\b")
+_MULTI_US_RE = re.compile(r"_+")
+_NUM_RE = re.compile(r"\d+")
+
+# Label columns of the results frame, stored as categoricals
+_CATEGORY_COLUMNS = ("model", "metric", "lead_day", "variable", "ref_alias", "dataset")
+
+# Typed frame returned when there is nothing to load
+_EMPTY_DF = pd.DataFrame(
+    {
+        "model": pd.Series(dtype="category"),
+        "metric": pd.Series(dtype="category"),
+        "lead_day": pd.Series(dtype="category"),
+        "variable": pd.Series(dtype="category"),
+        "score": pd.Series(dtype=float),
+        "ref_alias": pd.Series(dtype="category"),
+        "dataset": pd.Series(dtype="category"),
+    }
+)
+
+
+@lru_cache(maxsize=None)
 def get_depth_order(variable_name: str) -> int:
     """Extract depth from variable name for sorting."""
     variable_lower = variable_name.lower()
     if "surface" in variable_lower:
         return 0
     # Extract depth numbers (50m, 200m, etc.)
-    depth_match = re.search(r"(\d+)m", variable_lower)
+    depth_match = _DEPTH_RE.search(variable_lower)
     if depth_match:
         return int(depth_match.group(1))
     return 999  # Put variables without depth at the end
 
 
+@lru_cache(maxsize=None)
 def get_variable_type(variable_name: str) -> str:
     """Extract variable type (without depth) from variable name."""
     variable_lower = variable_name.lower()
 
     # Remove depth indications
     # Remove "surface", depths in meters, etc.
-    cleaned_var = re.sub(r"\bsurface\b", "", variable_lower)
-    cleaned_var = re.sub(r"\d+m\b", "", cleaned_var)
-    cleaned_var = re.sub(r"\d+_m\b", "", cleaned_var)
-    cleaned_var = re.sub(r"_surface\b", "", cleaned_var)
+    cleaned_var = _SURFACE_OR_DEPTH_RE.sub("", variable_lower)
+    cleaned_var = _DEPTH_UM_RE.sub("", cleaned_var)
+    cleaned_var = _SURFACE_SUFFIX_RE.sub("", cleaned_var)
 
     # Clean underscores and multiple spaces
-    cleaned_var = re.sub(r"_+", "_", cleaned_var)
+    cleaned_var = _MULTI_US_RE.sub("_", cleaned_var)
     cleaned_var = cleaned_var.strip("_").strip()
 
     # If cleaned variable is empty, use original variable
@@ -61,13 +131,10 @@ def get_variable_type(variable_name: str) -> str:
 
 def sort_variables_by_type_and_depth(variables: List[str]) -> List[str]:
     """Sort variables by type then depth."""
-
-    def sort_key(var: str) -> Tuple[str, int, str]:
-        var_type = get_variable_type(var)
-        depth = get_depth_order(var)
-        return var_type, depth, var
-
-    return sorted(variables, key=sort_key)
+    # Decorate-sort-undecorate: keys are extracted once, then tuples compare natively
+    decorated = [(get_variable_type(var), get_depth_order(var), var) for var in variables]
+    decorated.sort()
+    return [var for _, _, var in decorated]
 
 
 def get_lead_days_for_display(all_lead_days: List[str], max_count: int = 5) -> List[str]:
@@ -81,9 +148,9 @@ def get_lead_days_for_display(all_lead_days: List[str], max_count: int = 5) -> L
     # Extract and sort all lead days numerically
     lead_days_with_nums = []
     for ld in all_lead_days:
-        m = re.search(r"(\d+)", ld)
+        m = _NUM_RE.search(ld)
         if m:
-            lead_days_with_nums.append((int(m.group(1)), ld))
+            lead_days_with_nums.append((int(m.group(0)), ld))
 
     lead_days_with_nums.sort()
 
@@ -108,71 +175,110 @@ def get_lead_days_for_display(all_lead_days: List[str], max_count: int = 5) -> L
     return selected
 
 
+def _read_json(path: Path) -> Any:
+    """Read and parse a JSON file."""
+    return _json_loads(path.read_bytes())
+
+
 def load_data(results_dir: Path) -> pd.DataFrame:
     """Load all JSON results into a DataFrame."""
-    files = list(Path(results_dir).glob("*.json"))
-    data = []
-
-    for file in files:
-        with open(file) as f:
-            content = json.load(f)
-
-            # Check format
-            if "dataset" in content and "results" in content:
-                dataset_name = content["dataset"]
-
-                # Iterate over results for this dataset
-                for model_key, entries in content["results"].items():
-                    if isinstance(entries, list):
-                        for entry in entries:
-                            model = entry.get("model", model_key)
-                            ref_alias = entry.get("ref_alias", "unknown")
-                            lead_time = entry.get("lead_time", None)
-                            lead_day = (
-                                f"Lead day {lead_time + 1}" if lead_time is not None else "unknown"
-                            )
-                            result = entry.get("result", [])
-
-                            # Process each item in result
-                            if isinstance(result, list):
-                                for item in result:
-                                    metric = item.get("Metric", "unknown")
-                                    variable = item.get("Variable", "unknown")
-                                    value = item.get("Value", 0)
-
-                                    if not isinstance(value, (int, float)):
-                                        continue
-
-                                    data.append(
-                                        {
-                                            "model": model,
-                                            "metric": metric,
-                                            "lead_day": lead_day,
-                                            "variable": variable,
-                                            "score": value,
-                                            "ref_alias": ref_alias,
-                                            "dataset": dataset_name,
-                                        }
+    results_dir = Path(results_dir)
+    if not results_dir.is_dir():
+        return _EMPTY_DF.copy()
+    # Same selection as glob("*.json"), dotfiles included
+    with os.scandir(results_dir) as it:
+        files = [Path(entry.path) for entry in it if entry.name.endswith(".json")]
+    if not files:
+        return _EMPTY_DF.copy()
+
+    # One list per column: the DataFrame is built once from columns
+    models: List[str] = []
+    metrics: List[str] = []
+    lead_days: List[str] = []
+    variables: List[str] = []
+    scores: List[float] = []
+    refs: List[str] = []
+    datasets: List[str] = []
+
+    def add_row(model: str, metric: str, lead_day: str, variable: str, score: float,
+                ref_alias: str, dataset_name: str) -> None:
+        models.append(model)
+        metrics.append(metric)
+        lead_days.append(lead_day)
+        variables.append(variable)
+        scores.append(score)
+        refs.append(ref_alias)
+        datasets.append(dataset_name)
+
+    # Reading and parsing overlap across files; rows are built in file order
+    with ThreadPoolExecutor(max_workers=min(32, len(files))) as executor:
+        contents = list(executor.map(_read_json, files))
+
+    for content in contents:
+        # Check format
+        if "dataset" in content and "results" in content:
+            dataset_name = content["dataset"]
+
+            # Iterate over results for this dataset
+            for model_key, entries in content["results"].items():
+                if isinstance(entries, list):
+                    for entry in entries:
+                        model = entry.get("model", model_key)
+                        ref_alias = entry.get("ref_alias", "unknown")
+                        lead_time = entry.get("lead_time", None)
+                        lead_day = (
+                            f"Lead day {lead_time + 1}" if lead_time is not None else "unknown"
+                        )
+                        result = entry.get("result", [])
+
+                        # Process each item in result
+                        if isinstance(result, list):
+                            for item in result:
+                                value = item.get("Value", 0)
+
+                                if not isinstance(value, (int, float)):
+                                    continue
+
+                                add_row(
+                                    model,
+                                    item.get("Metric", "unknown"),
+                                    lead_day,
+                                    item.get("Variable", "unknown"),
+                                    value,
+                                    ref_alias,
+                                    dataset_name,
+                                )
+                        elif isinstance(result, dict):
+                            # Process dict format (like glorys)
+                            for metric_name, variables_scores in result.items():
+                                for variable, score in variables_scores.items():
+                                    add_row(
+                                        model,
+                                        metric_name,
+                                        lead_day,
+                                        variable,
+                                        score,
+                                        ref_alias,
+                                        dataset_name,
                                     )
-                            elif isinstance(result, dict):
-                                # Process dict format (like glorys)
-                                for metric_name, variables in result.items():
-                                    for variable, score in variables.items():
-                                        data.append(
-                                            {
-                                                "model": model,
-                                                "metric": metric_name,
-                                                "lead_day": lead_day,
-                                                "variable": variable,
-                                                "score": score,
-                                                "ref_alias": ref_alias,
-                                                "dataset": dataset_name,
-                                            }
-                                        )
-
-    if not data:
-        return pd.DataFrame()
-    return pd.DataFrame(data)
+
+    if not models:
+        return _EMPTY_DF.copy()
+    df = pd.DataFrame(
+        {
+            "model": models,
+            "metric": metrics,
+            "lead_day": lead_days,
+            "variable": variables,
+            "score": scores,
+            "ref_alias": refs,
+            "dataset": datasets,
+        }
+    )
+    # Low-cardinality labels: comparisons and groupbys work on integer codes
+    for col in _CATEGORY_COLUMNS:
+        df[col] = df[col].astype("category")
+    return df
 
 
 def bold_reference_index(val: str, reference_model: str) -> str:
@@ -180,19 +286,35 @@ def bold_reference_index(val: str, reference_model: str) -> str:
     return "font-weight: bold;" if val == reference_model else ""
 
 
-def _color_cells(val: float, percent: float, real_cmap: Colormap, norm: Normalize) -> str:
-    """Helper to color cells based on percentage difference."""
-    if pd.isna(percent):
-        return ""
-    color = real_cmap(norm(percent))
-    return (
-        f"background-color: rgba({int(color[0] * 255)},"
-        f"{int(color[1] * 255)},{int(color[2] * 255)},{color[3]:.2f})"
-    )
+def _present_values(series: pd.Series) -> List[Any]:
+    """Distinct values of a column, read from the categories when categorical."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.remove_unused_categories().cat.categories.tolist()
+    return list(series.unique())
+
+
+def _color_cells(percent: np.ndarray, real_cmap: Colormap, norm: Normalize) -> np.ndarray:
+    """Helper to color cells based on percentage difference.
+
+    Colors for the whole 2-D array are computed in one colormap call; NaN
+    cells get an empty style.
+    """
+    rgba = real_cmap(norm(percent))
+    rgb = (rgba[..., :3] * 255).astype(np.uint8).reshape(-1, 3).tolist()
+    alpha = rgba[..., 3].ravel().tolist()
+    css = np.array(
+        [f"background-color: rgba({r},{g},{b},{a:.2f})" for (r, g, b), a in zip(rgb, alpha)],
+        dtype=object,
+    ).reshape(percent.shape)
+    css[np.isnan(percent)] = ""
+    return css
 
 
 def generate_report_items(
-    df: pd.DataFrame, cmap_code: str = "coolwarm", config: Optional[Dict[str, Any]] = None
+    df: pd.DataFrame,
+    cmap_code: str = "coolwarm",
+    config: Optional[Dict[str, Any]] = None,
+    uuid_prefix: Optional[str] = None,
 ) -> Generator[Tuple[str, Any], None, None]:
     """
     Yield (type, content) items for the report.
@@ -206,7 +328,12 @@ def generate_report_items(
           'reference_header': "## Reference dataset: {ref_alias}"
           'metric_header': "### Metric: {metric_name}"
           'variable_group_header': "#### {var_type} Variables"
+
+    uuid_prefix: prefix of the table ids (``T_<prefix>_<n>``); defaults to a
+      per-call counter so tables from several reports never share an id
     """
+    if uuid_prefix is None:
+        uuid_prefix = f"r{next(_REPORT_IDS)}"
     if config is None:
         config = {}
 
@@ -214,13 +341,20 @@ def generate_report_items(
     variables_map = config.get("variables_names", {})
     models_map = config.get("models_names", {})
     texts = config.get("texts", {})
+    ref_header_tmpl = texts.get("reference_header", "## Reference dataset: {ref_alias}")
+    metric_header_tmpl = texts.get("metric_header", "### Metric: {metric_name}")
+    vargroup_header_tmpl = texts.get("variable_group_header", "#### {var_type} Variables")
 
     # Apply model aliasing if provided
     if models_map:
-        df["dataset"] = df["dataset"].map(lambda x: models_map.get(x, x))
-        df["model"] = df["model"].map(lambda x: models_map.get(x, x))
+        for col in ("dataset", "model"):
+            aliased = df[col].map(lambda x: models_map.get(x, x))
+            if isinstance(aliased.dtype, pd.CategoricalDtype):
+                # map keeps the original category order; tables sort by display name
+                aliased = aliased.cat.reorder_categories(sorted(aliased.cat.categories))
+            df[col] = aliased
 
-    yield ("markdown", '<div style="height: 90px;"></div>')
+    yield ("markdown", _TOP_SPACER_HTML)
 
     if len(df) == 0:
         yield ("markdown", "## Aucune donnée trouvée dans les fichiers JSON")
@@ -228,18 +362,25 @@ def generate_report_items(
 
     # Check for lead days
     if "lead_day" in df.columns:
-        all_unique_lead_days = df["lead_day"].unique()
-        lead_days = get_lead_days_for_display(list(all_unique_lead_days), max_count=5)
+        lead_days = get_lead_days_for_display(_present_values(df["lead_day"]), max_count=5)
     else:
         lead_days = []
 
     reference_model = "glonet"  # Default
 
-    for ref_alias in sorted(df["ref_alias"].unique()):
-        header = texts.get("reference_header", "## Reference dataset: {ref_alias}")
-        yield ("markdown", header.format(ref_alias=ref_alias.upper()))
+    # The colormap never changes across tables
+    real_cmap = plt.get_cmap(cmap_code)
+
+    # Short per-table ids keep the scoped CSS selectors distinct within a page
+    table_ids = count()
+
+    # Partition once by reference dataset instead of re-filtering the full frame
+    ref_frames = dict(tuple(df.groupby("ref_alias", sort=False, observed=True)))
 
-        ref_df = df[df.ref_alias == ref_alias]
+    for ref_alias in sorted(ref_frames):
+        yield ("markdown", ref_header_tmpl.format(ref_alias=ref_alias.upper()))
+
+        ref_df = ref_frames[ref_alias]
 
         # Determine reference model for this dataset
         datasets_in_ref = ref_df["dataset"].unique()
@@ -252,43 +393,37 @@ def generate_report_items(
 
         # Sort all variables by type and depth
         all_variables = sort_variables_by_type_and_depth(
-            list(ref_df["variable"].unique())
+            _present_values(ref_df["variable"])
         )
 
-        # Group variables by type
-        variables_by_type: Dict[str, List[str]] = {}
-        for var in all_variables:
-            var_type = get_variable_type(var)
-            if var_type not in variables_by_type:
-                variables_by_type[var_type] = []
-            variables_by_type[var_type].append(var)
-
-        # Loop: variable group first, then metric
-        for var_type, var_group in variables_by_type.items():
-            header = texts.get("variable_group_header", "#### {var_type} Variables")
-            yield ("markdown", header.format(var_type=var_type.title()))
-
-            # When the pipeline provides an explicit allowed_metrics list
-            # (derived from the sources' metrics in the project YAML), use it
-            # as a whitelist.  This hides sub-statistics (me, mse, …) that
-            # metric classes may emit automatically.
-            # metrics_names is intentionally NOT used as a filter here: it is
-            # only a renaming map for display labels.
-            _available = sorted(ref_df.metric.unique())
-            _allowed = (config or {}).get("allowed_metrics")
-            if _allowed:
-                _filtered = [m for m in _available if m in _allowed]
-                _available = _filtered if _filtered else _available
+        # Partition once by metric; variable groups only filter these subframes
+        metric_frames = dict(tuple(ref_df.groupby("metric", sort=False, observed=True)))
+
+        # When the pipeline provides an explicit allowed_metrics list
+        # (derived from the sources' metrics in the project YAML), use it
+        # as a whitelist.  This hides sub-statistics (me, mse, …) that
+        # metric classes may emit automatically.
+        # metrics_names is intentionally NOT used as a filter here: it is
+        # only a renaming map for display labels.
+        _available = sorted(metric_frames)
+        _allowed = (config or {}).get("allowed_metrics")
+        if _allowed:
+            _filtered = [m for m in _available if m in _allowed]
+            _available = _filtered if _filtered else _available
+
+        # Loop: variable group first, then metric.
+        # Variables are sorted by type, so each type is one contiguous run.
+        for var_type, var_group_iter in groupby(all_variables, key=get_variable_type):
+            var_group = list(var_group_iter)
+            yield ("markdown", vargroup_header_tmpl.format(var_type=var_type.title()))
 
             for metric in _available:
                 metric_complete_name = metrics_map.get(metric, metric)
-                header = texts.get("metric_header", "### Metric: {metric_name}")
-                yield ("markdown", header.format(metric_name=metric_complete_name))
+                yield ("markdown", metric_header_tmpl.format(metric_name=metric_complete_name))
 
                 # Filter on ref_alias, metric AND variable group
-                ref_metric_df = ref_df[
-                    (ref_df.metric == metric) & ref_df.variable.isin(var_group)
-                ]
+                metric_df = metric_frames[metric]
+                ref_metric_df = metric_df[metric_df.variable.isin(var_group)]
 
                 # Filter on odd lead days
                 sub = ref_metric_df[
@@ -299,31 +434,25 @@ def generate_report_items(
                     yield ("markdown", "*No data available for these variables and lead days.*")
                     continue
 
-                # Ensure lead day 1 is included if exists
-                available_leads = sorted(
-                    sub["lead_day"].unique(),
-                    key=lambda x: int(re.search(r"\d+", x).group(0)),  # type: ignore
-                )
-
-                # Use pre-selected lead days that are available in data
+                # Use pre-selected lead days that are available in data.
+                # sub only holds pre-selected lead days, so it needs no second filter.
+                available_leads = set(_present_values(sub["lead_day"]))
                 common_leads = [ld for ld in lead_days if ld in available_leads]
 
-                # If no common lead days, take first available ones
-                if not common_leads:
-                    common_leads = available_leads[:4]
-
-                sub = sub[sub.lead_day.isin(common_leads)]
-
-                if len(sub) == 0:
-                    yield ("markdown", "*No data available for selected lead days.*")
-                    continue
-
                 # Multi-index pivot with correct variable order
                 # First sort variables in desired order
-                ordered_variables = [var for var in var_group if var in sub["variable"].unique()]
-
-                pivot = sub.pivot_table(
-                    index="model", columns=["variable", "lead_day"], values="score", aggfunc="mean"
+                present_vars = set(_present_values(sub["variable"]))
+                ordered_variables = [var for var in var_group if var in present_vars]
+
+                # Columns are reordered explicitly below, only the model rows need sorting
+                pivot = (
+                    sub.groupby(["model", "variable", "lead_day"], sort=False, observed=True)["score"]
+                    .mean()
+                    .unstack(["variable", "lead_day"])
+                    # Drop all-NaN models and columns, as pivot_table(dropna=True) did
+                    .dropna(how="all")
+                    .dropna(axis=1, how="all")
+                    .sort_index()
                 )
 
                 # Reorganize columns for correct order
@@ -347,47 +476,34 @@ def generate_report_items(
                     yield ("markdown", "*No data to display.*")
                     continue
 
-                # Reorder to put reference model first
-                if reference_model in pivot.index:
+                # Reorder to put reference model first.
+                # Without a reference model there is nothing to color or bold.
+                has_reference = reference_model in pivot.index
+                styles_df: Optional[pd.DataFrame] = None
+                if has_reference:
                     new_order = [reference_model] + [m for m in pivot.index if m != reference_model]
                     pivot = pivot.reindex(new_order)
-                    ref_values = pivot.loc[reference_model]
-                    percent_diff = (pivot - ref_values) / ref_values * 100
-                else:
-                    # If no reference model, no coloring
-                    ref_values = None
-                    percent_diff = pd.DataFrame(0, index=pivot.index, columns=pivot.columns)
-
-                # Dynamic color scale calculation
-                if ref_values is not None:
-                    non_ref_values = percent_diff.values[1:] if len(percent_diff) > 1 else []
+                    # Percent difference to the reference row, on raw values
+                    values = pivot.to_numpy(dtype=float)
+                    with np.errstate(divide="ignore", invalid="ignore"):
+                        percent_diff = (values - values[0]) / values[0] * 100.0
+
+                    # Dynamic color scale calculation
+                    non_ref_values = percent_diff[1:]
                     if len(non_ref_values) > 0 and not np.all(np.isnan(non_ref_values)):
                         absmax = np.nanmax(np.abs(non_ref_values))
                         # Minimum % for stronger contrast
                         absmax = max(absmax, 2)
                     else:
                         absmax = 2  # default value
-                else:
-                    absmax = 2
-
-                norm = plt.Normalize(-absmax, absmax)
-                real_cmap = plt.get_cmap(cmap_code)
-
-                def style_func(
-                    df_style: pd.DataFrame,
-                    p_diff: pd.DataFrame = percent_diff,
-                    r_cmap: Colormap = real_cmap,
-                    n_orm: Normalize = norm,
-                ) -> pd.DataFrame:
-                    styled_df = pd.DataFrame("", index=df_style.index, columns=df_style.columns)
-                    for i in df_style.index:
-                        for j in df_style.columns:
-                            # Using correct type access
-                            percent = p_diff.loc[i, j]
-                            styled_df.loc[i, j] = _color_cells(
-                                df_style.loc[i, j], percent, r_cmap, n_orm
-                            )
-                    return styled_df
+                    norm = plt.Normalize(-absmax, absmax)
+
+                    # Cell styles are built once, up front, with the pivot's shape
+                    styles_df = pd.DataFrame(
+                        _color_cells(percent_diff, real_cmap, norm),
+                        index=pivot.index,
+                        columns=pivot.columns,
+                    )
 
                 # Determine where each variable starts for borders
                 styles = []
@@ -420,28 +536,16 @@ def generate_report_items(
                         col_idx += 1
 
                 # Add specific formatting to match the expected output
-                styles.extend([
-                    # Center align data cells (skipping the first column which is the index)
-                    {"selector": "td:not(:first-child)", "props": [("text-align", "center")]},
-                    # Center align all headers
-                    {"selector": "th.col_heading", "props": [("text-align", "center")]},
-                    # Variable headers (Level 0): Bold
-                    {
-                        "selector": "th.col_heading.level0",
-                        "props": [("text-align", "center"), ("font-weight", "bold")],
-                    },
-                    # Lead day headers (Level 1): Smaller font
-                    {
-                        "selector": "th.col_heading.level1",
-                        "props": [("text-align", "center"), ("font-size", "0.9em")],
-                    },
-                ])
-
-                styled = pivot.style.apply(style_func, axis=None).format("{:.3f}")
-
-                # Apply the variable-separator border styles
-                if styles:
-                    styled = styled.set_table_styles(styles)
+                styles.extend(_STATIC_TABLE_STYLES)
+
+                # Cell ids are only emitted for styled cells; CSS is scoped by table uuid
+                styled = Styler(pivot, uuid=f"{uuid_prefix}_{next(table_ids)}", cell_ids=False)
+                if styles_df is not None:
+                    styled = styled.apply(lambda _, css=styles_df: css, axis=None)
+                styled = styled.format("{:.3f}")
+
+                # Apply the variable-separator border and static table styles
+                styled = styled.set_table_styles(styles)
 
                 pivot.columns.names = ["Variable", "Lead Day"]
                 pivot.index.name = None
@@ -450,12 +554,13 @@ def generate_report_items(
                 styled = styled.set_table_attributes('class="dataframe table"')
                 
                 # Use default value in lambda for loop variable reference_model
-                styled = styled.map_index(
-                    lambda val, ref=reference_model: bold_reference_index(val, ref), axis=0
-                )
+                if has_reference:
+                    styled = styled.map_index(
+                        lambda val, ref=reference_model: bold_reference_index(val, ref), axis=0
+                    )
 
                 yield ("styler", styled)
-                yield ("markdown", '<div style="height: 50px;"></div>')
+                yield ("markdown", _SPACER_HTML)
 
 
 def create_legend_plot(cmap_code: str = "coolwarm") -> plt.Figure:
@@ -3,12 +3,15 @@ Script to run the leaderboard generation locally using the current environment.
 It uses the pure-Python builder and skips Poetry/Quarto checks.
 
 Usage:
-    python run_local.py [--config PATH/TO/leaderboard_config.yaml]
+    python run_local.py [--config PATH/TO/leaderboard_config.yaml] [--quiet]
+
+The log level defaults to $DCLB_LOG (INFO if unset); --quiet lowers it to WARNING.
 
 If --config is not provided, the script uses the bundled default config:
     dcleaderboard/config/leaderboard_texts.yaml
 """
 import argparse
+import os
 import sys
 from pathlib import Path
 
@@ -38,8 +41,19 @@ def main():
             f"Defaults to {_DEFAULT_CONFIG}."
         ),
     )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only log warnings and errors.",
+    )
     args = parser.parse_args()
 
+    logger.remove()
+    logger.add(
+        sys.stderr,
+        level="WARNING" if args.quiet else os.environ.get("DCLB_LOG", "INFO"),
+    )
+
     base_dir = current_file.parent
     results_dir = base_dir / "results"
     site_dir = base_dir / "_site"
@@ -74,7 +88,7 @@ def main():
         )
         logger.success("Build successful! Open {}/leaderboard.html to view.", site_dir)
     except Exception as e:
-        logger.error("Build failed: {}", e)
+        logger.exception("Build failed: {}", e)
         sys.exit(1)
 
 
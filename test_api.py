@@ -4,20 +4,22 @@ Script de test pour vérifier l'API publique de dcleaderboard.
 Simule une utilisation par une librairie externe.
 """
 
+import os
 import sys
 from pathlib import Path
 import pandas as pd
+from loguru import logger
 
 def check_dcleaderboard_api():
-    print("🔎 Vérification de l'accessibilité du package `dcleaderboard`...")
+    logger.info("🔎 Vérification de l'accessibilité du package `dcleaderboard`...")
     
     try:
         import dcleaderboard
-        print(f"✅ Import réussi: {dcleaderboard}")
-        print(f"   Chemin: {dcleaderboard.__file__}")
+        logger.success(f"✅ Import réussi: {dcleaderboard}")
+        logger.info(f"   Chemin: {dcleaderboard.__file__}")
     except ImportError as e:
-        print(f"❌ Échec de l'import: {e}")
-        print("   Assurez-vous que le package est installé ou accessible dans le PYTHONPATH.")
+        logger.error(f"❌ Échec de l'import: {e}")
+        logger.info("   Assurez-vous que le package est installé ou accessible dans le PYTHONPATH.")
         return False
 
     # Vérification des symboles exposés
@@ -25,13 +27,13 @@ def check_dcleaderboard_api():
     missing = [s for s in expected_symbols if not hasattr(dcleaderboard, s)]
     
     if missing:
-        print(f"❌ Symboles manquants dans l'API publique: {missing}")
+        logger.error(f"❌ Symboles manquants dans l'API publique: {missing}")
         return False
     else:
-        print(f"✅ Tous les symboles attendus sont présents: {expected_symbols}")
+        logger.success(f"✅ Tous les symboles attendus sont présents: {expected_symbols}")
 
     # Test fonctionnel simple : load_data et generate_report_items
-    print("\n🧪 Test fonctionnel...")
+    logger.info("🧪 Test fonctionnel...")
     
     # On cherche le dossier results relativements au script
     results_path = Path("dcleaderboard/results")
@@ -40,40 +42,126 @@ def check_dcleaderboard_api():
          results_path = Path("results")
     
     if not results_path.exists():
-        print(f"⚠️ Impossible de trouver un dossier de résultats pour le test (cherché dans {Path.cwd()})")
+        logger.warning(f"⚠️ Impossible de trouver un dossier de résultats pour le test (cherché dans {Path.cwd()})")
         return True # On considère que l'API est OK structurellement même si on peut pas tester la data
 
-    print(f"📂 Chargement des données depuis: {results_path}")
+    logger.info(f"📂 Chargement des données depuis: {results_path}")
     try:
         df = dcleaderboard.load_data(results_path)
-        print(f"✅ Données chargées. DataFrame shape: {df.shape}")
+        logger.success(f"✅ Données chargées. DataFrame shape: {df.shape}")
     except Exception as e:
-        print(f"❌ Erreur lors de load_data: {e}")
+        logger.error(f"❌ Erreur lors de load_data: {e}")
         return False
 
-    print("📊 Génération des éléments du rapport...")
+    logger.info("📊 Génération des éléments du rapport...")
     try:
         # Test avec une config vide
         items = list(dcleaderboard.generate_report_items(df))
-        print(f"✅ Génération réussie. {len(items)} éléments produits.")
+        logger.success(f"✅ Génération réussie. {len(items)} éléments produits.")
         
         # Vérification des types
         types = [t for t, _ in items]
-        print(f"   Types d'éléments: {set(types)}")
+        logger.info(f"   Types d'éléments: {set(types)}")
         
         has_table = "styler" in types
         has_md = "markdown" in types
         
         if has_table and has_md:
-            print("✅ Les types de retour semblent corrects (styler + markdown).")
+            logger.success("✅ Les types de retour semblent corrects (styler + markdown).")
         else:
-            print(f"⚠️ Types de retour inhabituels: {set(types)}")
+            logger.warning(f"⚠️ Types de retour inhabituels: {set(types)}")
             
     except Exception as e:
-        print(f"❌ Erreur lors de generate_report_items: {e}")
+        logger.error(f"❌ Erreur lors de generate_report_items: {e}")
         return False
 
-    print("\n🎨 Test de la personnalisation (Custom Config)...")
+    logger.info("🔤 Test de l'ordre des modèles renommés (models_names)...")
+    multi_model_path = results_path / "dc2"
+    if not multi_model_path.exists():
+        logger.warning(f"⚠️ Dossier multi-modèles introuvable ({multi_model_path}), test ignoré.")
+    else:
+        try:
+            df_multi = dcleaderboard.load_data(multi_model_path)
+            # Les alias inversent l'ordre alphabétique des noms d'origine
+            alias_config = {
+                "models_names": {
+                    "challenger_model_1": "Zeta model",
+                    "challenger_model_2": "Alpha model",
+                }
+            }
+            tables = [
+                content
+                for t, content in dcleaderboard.generate_report_items(df_multi, config=alias_config)
+                if t == "styler"
+            ]
+            bad_orders = {
+                tuple(s.data.index)
+                for s in tables
+                if list(s.data.index[1:]) != sorted(s.data.index[1:])
+            }
+            if not tables:
+                logger.error("❌ Aucun tableau produit avec les modèles renommés.")
+                return False
+            if bad_orders:
+                logger.error(f"❌ Modèles non triés par nom affiché: {bad_orders}")
+                return False
+            logger.success(f"✅ {len(tables)} tableaux triés par nom affiché.")
+        except Exception as e:
+            logger.error(f"❌ Erreur lors du test des alias de modèles: {e}")
+            return False
+
+    logger.info("🕳️ Test des scores NaN...")
+    if not multi_model_path.exists():
+        logger.warning(f"⚠️ Dossier multi-modèles introuvable ({multi_model_path}), test ignoré.")
+    else:
+        try:
+            import json
+            import shutil
+            import tempfile
+
+            nan_variable = "Surface height"
+            with tempfile.TemporaryDirectory() as tmp:
+                for f in multi_model_path.glob("results_*.json"):
+                    shutil.copy(f, tmp)
+                # Tous les scores glonet d'une variable passent à NaN (écrits tels quels par json.dump)
+                glonet_file = Path(tmp) / "results_glonet.json"
+                data = json.loads(glonet_file.read_text(encoding="utf-8"))
+                for entries in data["results"].values():
+                    for entry in entries:
+                        for item in entry.get("result") or []:
+                            if item.get("Variable") == nan_variable:
+                                item["Value"] = float("nan")
+                glonet_file.write_text(json.dumps(data), encoding="utf-8")
+
+                df_nan = dcleaderboard.load_data(Path(tmp))
+
+            tables = [
+                content
+                for t, content in dcleaderboard.generate_report_items(df_nan)
+                if t == "styler"
+            ]
+            nan_rows = [
+                tuple(s.data.index[s.data.isna().all(axis=1)])
+                for s in tables
+                if s.data.isna().all(axis=1).any()
+            ]
+            nan_cols = [
+                tuple(s.data.columns[s.data.isna().all(axis=0)])
+                for s in tables
+                if s.data.isna().all(axis=0).any()
+            ]
+            if not df_nan["score"].isna().any():
+                logger.error("❌ Les scores NaN n'ont pas été chargés.")
+                return False
+            if nan_rows or nan_cols:
+                logger.error(f"❌ Lignes/colonnes entièrement NaN affichées: {nan_rows} {nan_cols}")
+                return False
+            logger.success(f"✅ {len(tables)} tableaux sans ligne ni colonne entièrement NaN.")
+        except Exception as e:
+            logger.error(f"❌ Erreur lors du test des scores NaN: {e}")
+            return False
+
+    logger.info("🎨 Test de la personnalisation (Custom Config)...")
     try:
         import shutil
         output_dir = Path("_test_site_custom")
@@ -92,7 +180,7 @@ def check_dcleaderboard_api():
             }
         }
         
-        print(f"   Génération du site dans {output_dir} avec config custom...")
+        logger.info(f"   Génération du site dans {output_dir} avec config custom...")
         dcleaderboard.render_site_from_results_dir(
             results_dir=results_path,
             output_site_dir=output_dir,
@@ -101,7 +189,7 @@ def check_dcleaderboard_api():
         
         html_file = output_dir / "leaderboard.html"
         if not html_file.exists():
-            print("❌ Le fichier HTML n'a pas été généré.")
+            logger.error("❌ Le fichier HTML n'a pas été généré.")
             return False
             
         content = html_file.read_text(encoding="utf-8")
@@ -116,9 +204,9 @@ def check_dcleaderboard_api():
         all_ok = True
         for text, desc in checks:
             if text in content:
-                print(f"   ✅ {desc} trouvé.")
+                logger.success(f"   ✅ {desc} trouvé.")
             else:
-                print(f"   ❌ {desc} NON trouvé ('{text}').")
+                logger.error(f"   ❌ {desc} NON trouvé ('{text}').")
                 all_ok = False
         
         # Nettoyage
@@ -129,15 +217,16 @@ def check_dcleaderboard_api():
             return False
             
     except Exception as e:
-        print(f"❌ Erreur lors du test de personnalisation: {e}")
-        # On affiche la stacktrace pour debug
-        import traceback
-        traceback.print_exc()
+        # logger.exception inclut la stacktrace pour debug
+        logger.exception(f"❌ Erreur lors du test de personnalisation: {e}")
         return False
 
-    print("\n✨ Test de l'API terminé avec succès.")
+    logger.success("✨ Test de l'API terminé avec succès.")
     return True
 
 if __name__ == "__main__":
+    # DCLB_LOG=WARNING pour n'afficher que les anomalies (boucles CI)
+    logger.remove()
+    logger.add(sys.stderr, level=os.environ.get("DCLB_LOG", "INFO"))
     success = check_dcleaderboard_api()
     sys.exit(0 if success else 1)